@@ -7,6 +7,9 @@ class Player:
     Player class representing Steve (the main character).
     Handles movement, physics, collision detection, and sprite rendering.
     """
+    __slots__ = ('spawn_x', 'spawn_y', 'rect', 'velocity_x', 'velocity_y', 'on_ground',
+                 '_probe', 'selected_block', 'facing_right', 'image', 'image_flip')
+    
     def __init__(self, x, y):
         """
         Initialize the player at the given spawn position.
@@ -26,6 +29,9 @@ class Player:
         self.velocity_x = 0
         self.on_ground = False
         
+        # Reusable rect for collision probes, avoids a Rect allocation per check
+        self._probe = pygame.Rect(0, 0, 0, 0)
+        
         # Game state
         self.selected_block = 'dirt'  
         self.facing_right = True      
@@ -53,9 +59,12 @@ class Player:
         Returns:
             bool: True if player is on ground, False if in air
         """
-        test_rect = self.rect.copy()
-        test_rect.y += 1
-        return world.check_collision(test_rect)
+        probe = self._probe
+        probe.x = self.rect.x
+        probe.y = self.rect.y + 1
+        probe.width = self.rect.width
+        probe.height = self.rect.height
+        return world.check_collision(probe)
         
     def update(self, world):
         """
@@ -87,30 +96,35 @@ class Player:
             self.velocity_y = min(self.velocity_y + GRAVITY, MAX_FALL_SPEED)
         
         # Horizontal movement and collision
-        self.rect.x += self.velocity_x
-        if world.check_collision(self.rect):
-            self.rect.x -= self.velocity_x
+        if self.velocity_x != 0:
+            probe = self._probe
+            probe.x = self.rect.x + self.velocity_x
+            probe.y = self.rect.y
+            probe.width = self.rect.width
+            probe.height = self.rect.height
+            if not world.check_collision(probe):
+                self.rect.x = probe.x
             
-        # Vertical movement and collision with pixel-perfect precision
+        # Vertical movement and collision, snapping flush against blocks
         if self.velocity_y != 0:
-            step = 1 if self.velocity_y > 0 else -1
-            for _ in range(abs(int(self.velocity_y))):
-                self.rect.y += step
-                if world.check_collision(self.rect):
-                    self.rect.y -= step
-                    self.velocity_y = 0
-                    break
+            distance = int(self.velocity_y)
+            moved = world.sweep_vertical(self.rect, distance)
+            self.rect.y += moved
+            if moved != distance:
+                self.velocity_y = 0
                     
         # Void check (fall detection)
         if self.rect.y > WORLD_HEIGHT * BLOCK_SIZE:
             self.respawn()
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0, camera_y=0):
         """
         Draw the player sprite on the screen.
         
         Args:
             screen: Pygame surface to draw on
+            camera_x (int): Camera X offset in pixels
+            camera_y (int): Camera Y offset in pixels
         """
         current_image = self.image if self.facing_right else self.image_flip
-        screen.blit(current_image, (self.rect.x, self.rect.y))
\ No newline at end of file
+        screen.blit(current_image, (self.rect.x - camera_x, self.rect.y - camera_y))
\ No newline at end of file
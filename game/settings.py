@@ -8,6 +8,11 @@ BLOCK_SIZE = 32
 WORLD_WIDTH = 100  
 WORLD_HEIGHT = 50  
 
+# Terrain generation (fractal Perlin noise)
+TERRAIN_FREQUENCY = 0.04
+TERRAIN_OCTAVES = 4
+TERRAIN_AMPLITUDE = 16
+
 # Basic colors for blocks and environment
 SKY_COLOR = (135, 206, 235)      
 DIRT_COLOR = (139, 69, 19)       
@@ -17,6 +22,15 @@ WATER_COLOR = (0, 0, 255, 128)
 BEDROCK_COLOR = (64, 64, 64)     
 WOOD_COLOR = (102, 51, 0)        
 
+# Block type identifiers stored in the world grid (0 is air)
+BLOCK_TYPES = ['air', 'dirt', 'grass', 'stone', 'water', 'bedrock', 'wood']
+BLOCK_IDS = {block_type: i for i, block_type in enumerate(BLOCK_TYPES)}
+AIR_ID = BLOCK_IDS['air']
+DIRT_ID = BLOCK_IDS['dirt']
+GRASS_ID = BLOCK_IDS['grass']
+STONE_ID = BLOCK_IDS['stone']
+BEDROCK_ID = BLOCK_IDS['bedrock']
+
 # Physics constants
 GRAVITY = 0.35          
 JUMP_SPEED = -6         
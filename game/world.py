@@ -1,8 +1,103 @@
 import pygame
 import random
-import math
+import numpy as np
 from .settings import *
-from .block import Block
+from .block import BLOCK_COLORS
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, without it the grid kernels below run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+def perlin_1d(xs, gradients):
+    """
+    Evaluate 1D Perlin gradient noise at the given sample positions.
+    
+    Args:
+        xs (ndarray): Non-negative sample positions
+        gradients (ndarray): Random gradient for each integer lattice point
+        
+    Returns:
+        ndarray: Noise values roughly in the range [-0.5, 0.5]
+    """
+    cells = xs.astype(np.int64)
+    t = xs - cells
+    g0 = gradients[cells % len(gradients)]
+    g1 = gradients[(cells + 1) % len(gradients)]
+    fade = t * t * t * (t * (t * 6 - 15) + 10)
+    return (1 - fade) * (g0 * t) + fade * (g1 * (t - 1))
+
+def fbm_1d(xs, gradients, octaves, persistence=0.5, lacunarity=2.0):
+    """
+    Layer several octaves of Perlin noise (fractal Brownian motion).
+    
+    Args:
+        xs (ndarray): Non-negative sample positions
+        gradients (ndarray): Random gradient for each integer lattice point
+        octaves (int): Number of noise layers to sum
+        persistence (float): Amplitude multiplier between octaves
+        lacunarity (float): Frequency multiplier between octaves
+        
+    Returns:
+        ndarray: Noise values roughly in the range [-1, 1]
+    """
+    total = np.zeros_like(xs, dtype=np.float64)
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+    for _ in range(octaves):
+        total += amplitude * perlin_1d(xs * frequency, gradients)
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+    return 2 * total / max_amplitude
+
+@njit(cache=True)
+def _collide(grid, start_x, end_x, start_y, end_y):
+    """
+    Check whether any cell in a rectangular range of the grid is solid.
+    
+    Args:
+        grid (ndarray): Block id grid indexed as grid[x, y]
+        start_x, end_x: Column range (end exclusive), already clamped to the grid
+        start_y, end_y: Row range (end exclusive), already clamped to the grid
+        
+    Returns:
+        bool: True if a solid cell was found
+    """
+    for x in range(start_x, end_x):
+        for y in range(start_y, end_y):
+            if grid[x, y]:
+                return True
+    return False
+
+@njit(cache=True)
+def _line_of_sight(grid, start_x, start_y, end_x, end_y):
+    """
+    Walk the cells between two grid positions with a DDA, excluding both ends.
+    Cells outside the grid count as air.
+    
+    Args:
+        grid (ndarray): Block id grid indexed as grid[x, y]
+        start_x, start_y: Starting cell
+        end_x, end_y: Ending cell
+        
+    Returns:
+        bool: True if no solid cell lies between the two positions
+    """
+    steps = max(abs(end_x - start_x), abs(end_y - start_y))
+    step_x = (end_x - start_x) / steps
+    step_y = (end_y - start_y) / steps
+    for i in range(1, steps):
+        x = int(round(start_x + i * step_x))
+        y = int(round(start_y + i * step_y))
+        if 0 <= x < grid.shape[0] and 0 <= y < grid.shape[1] and grid[x, y]:
+            return False
+    return True
 
 class World:
     """
@@ -11,45 +106,79 @@ class World:
     """
     def __init__(self):
         """Initialize an empty world and generate the terrain."""
-        self.blocks = {}
+        # Block ids indexed as grid[x, y], 0 is air
+        self.grid = np.zeros((WORLD_WIDTH, WORLD_HEIGHT), dtype=np.int8)
         self.generate_terrain()
         self.add_bedrock_borders()
+        self.build_surface()
+        
+        # Compile the grid kernels now rather than stalling the first frame
+        # or the first long-range click
+        _collide(self.grid, 0, 0, 0, 0)
+        _line_of_sight(self.grid, 0, 0, 2, 0)
     
     def generate_terrain(self):
         """
-        Generate a simple procedural terrain with hills.
-        Uses a basic noise algorithm to create natural-looking elevation changes.
+        Generate a procedural terrain with hills.
+        Heights come from layered Perlin noise and the grid is filled with
+        vectorized column masks instead of per-block loops.
         """
-        heights = []
-        height = WORLD_HEIGHT // 2
+        rng = np.random.default_rng(random.getrandbits(32))
+        gradients = rng.uniform(-1, 1, 256)
         
-        # Generate terrain heights using simple noise
-        for x in range(WORLD_WIDTH):
-            height += random.randint(-1, 1)
-            height = max(WORLD_HEIGHT // 3, min(height, WORLD_HEIGHT - 10))
-            heights.append(height)
+        # Generate terrain heights using fractal noise
+        xs = np.arange(WORLD_WIDTH) * TERRAIN_FREQUENCY
+        noise = fbm_1d(xs, gradients, TERRAIN_OCTAVES)
+        heights = (noise * TERRAIN_AMPLITUDE + WORLD_HEIGHT // 2).astype(np.int32)
+        heights = np.clip(heights, WORLD_HEIGHT // 3, WORLD_HEIGHT - 10)
         
-        # Create blocks based on height map
-        for x in range(WORLD_WIDTH):
-            for y in range(WORLD_HEIGHT):
-                if y > heights[x]:
-                    if y < WORLD_HEIGHT - 5: 
-                        self.blocks[(x, y)] = Block(x, y, 'stone')
-                    else:
-                        self.blocks[(x, y)] = Block(x, y, 'dirt')
-                elif y == heights[x]:
-                    self.blocks[(x, y)] = Block(x, y, 'grass')
+        # Fill the grid based on height map: stone below the surface,
+        # dirt near the bottom and grass on top
+        ys = np.arange(WORLD_HEIGHT)[None, :]
+        below_surface = ys > heights[:, None]
+        self.grid[below_surface] = STONE_ID
+        self.grid[below_surface & (ys >= WORLD_HEIGHT - 5)] = DIRT_ID
+        self.grid[np.arange(WORLD_WIDTH), heights] = GRASS_ID
     
     def add_bedrock_borders(self):
         """Add unbreakable bedrock borders to contain the player."""
         # Bottom border
-        for x in range(WORLD_WIDTH):
-            self.blocks[(x, WORLD_HEIGHT-1)] = Block(x, WORLD_HEIGHT-1, 'bedrock')
+        self.grid[:, WORLD_HEIGHT-1] = BEDROCK_ID
             
         # Side borders
-        for y in range(WORLD_HEIGHT):
-            self.blocks[(0, y)] = Block(0, y, 'bedrock')
-            self.blocks[(WORLD_WIDTH-1, y)] = Block(WORLD_WIDTH-1, y, 'bedrock')
+        self.grid[0, :] = BEDROCK_ID
+        self.grid[WORLD_WIDTH-1, :] = BEDROCK_ID
+    
+    def build_surface(self):
+        """
+        Pre-render the whole world onto a single cached surface.
+        The world only changes when blocks are broken or placed, so each
+        frame can blit this surface once instead of drawing every block.
+        """
+        # One pre-drawn tile per block id (fill + outline, plain sky for air)
+        self.block_tiles = []
+        for block_id, color in enumerate(BLOCK_COLORS):
+            tile = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
+            tile.fill(color)
+            if block_id != AIR_ID:
+                pygame.draw.rect(tile, (0, 0, 0), tile.get_rect(), 1)
+            self.block_tiles.append(tile)
+        
+        self.surface = pygame.Surface((WORLD_WIDTH * BLOCK_SIZE, WORLD_HEIGHT * BLOCK_SIZE))
+        self.surface.fill(SKY_COLOR)
+        tiles = self.block_tiles
+        self.surface.blits([(tiles[self.grid[x, y]], (x * BLOCK_SIZE, y * BLOCK_SIZE))
+                            for x, y in np.argwhere(self.grid)], doreturn=False)
+    
+    def _redraw_cell(self, x, y):
+        """
+        Repaint a single grid cell on the cached world surface.
+        
+        Args:
+            x (int): Grid X coordinate
+            y (int): Grid Y coordinate
+        """
+        self.surface.blit(self.block_tiles[self.grid[x, y]], (x * BLOCK_SIZE, y * BLOCK_SIZE))
     
     def get_surface_height(self, x):
         """
@@ -61,9 +190,9 @@ class World:
         Returns:
             int: Y coordinate of the first block, or mid-height if none found
         """
-        for y in range(WORLD_HEIGHT):
-            if (x, y) in self.blocks:
-                return y
+        solid = np.flatnonzero(self.grid[x])
+        if solid.size:
+            return int(solid[0])
         return WORLD_HEIGHT // 2
     
     def get_block(self, x, y):
@@ -75,14 +204,30 @@ class World:
             y (int): Y coordinate
             
         Returns:
-            Block: The block at the position, or None if empty
+            int: The block id at the position, or AIR_ID if empty or out of bounds
+        """
+        if 0 <= x < WORLD_WIDTH and 0 <= y < WORLD_HEIGHT:
+            return self.grid[x, y]
+        return AIR_ID
+    
+    def is_breakable(self, x, y):
+        """
+        Check if the block at the specified coordinates can be broken.
+        Bedrock blocks are unbreakable.
+        
+        Args:
+            x (int): X coordinate
+            y (int): Y coordinate
+            
+        Returns:
+            bool: True if the block can be broken, False otherwise
         """
-        return self.blocks.get((x, y))
+        return self.get_block(x, y) != BEDROCK_ID
     
     def check_line_of_sight(self, start_x, start_y, end_x, end_y):
         """
         Check if there are any blocks between two points.
-        Uses Bresenham's line algorithm for accurate line-of-sight checking.
+        Walks the grid cells along the line with a DDA (JIT-compiled when numba is available).
         
         Args:
             start_x, start_y: Starting point coordinates
@@ -102,37 +247,8 @@ class World:
             abs(start_block_y - end_block_y) <= 1):
             return True
             
-        # Modified Bresenham's algorithm
-        dx = abs(end_block_x - start_block_x)
-        dy = abs(end_block_y - start_block_y)
-        x = start_block_x
-        y = start_block_y
-        
-        step_x = 1 if start_block_x < end_block_x else -1
-        step_y = 1 if start_block_y < end_block_y else -1
-        
-        if dx > dy:
-            err = dx / 2
-            while x != end_block_x:
-                if (x, y) != (end_block_x, end_block_y) and self.get_block(x, y):
-                    return False
-                err -= dy
-                if err < 0:
-                    y += step_y
-                    err += dx
-                x += step_x
-        else:
-            err = dy / 2
-            while y != end_block_y:
-                if (x, y) != (end_block_x, end_block_y) and self.get_block(x, y):
-                    return False
-                err -= dx
-                if err < 0:
-                    x += step_x
-                    err += dy
-                y += step_y
-                
-        return True
+        return _line_of_sight(self.grid, start_block_x, start_block_y,
+                              end_block_x, end_block_y)
     
     def break_block(self, pos, player_pos):
         """
@@ -146,17 +262,17 @@ class World:
         block_y = pos[1] // BLOCK_SIZE
         
         # Basic checks
-        if (block_x, block_y) not in self.blocks:
+        if not self.get_block(block_x, block_y):
             return
-        if not self.blocks[(block_x, block_y)].is_breakable():
+        if not self.is_breakable(block_x, block_y):
             return
             
         player_block_x = player_pos[0] // BLOCK_SIZE
         player_block_y = player_pos[1] // BLOCK_SIZE
             
         # Range check
-        distance = math.sqrt((block_x - player_block_x) ** 2 + (block_y - player_block_y) ** 2)
-        if distance > 3:
+        distance_sq = (block_x - player_block_x) ** 2 + (block_y - player_block_y) ** 2
+        if distance_sq > 3 ** 2:
             return
             
         # Line of sight check
@@ -168,7 +284,8 @@ class World:
             return
             
         # All checks passed, remove the block
-        del self.blocks[(block_x, block_y)]
+        self.grid[block_x, block_y] = AIR_ID
+        self._redraw_cell(block_x, block_y)
     
     def has_adjacent_block(self, x, y):
         """
@@ -181,18 +298,19 @@ class World:
         Returns:
             bool: True if there's an adjacent block, False otherwise
         """
-        adjacent_positions = [
-            (x + 1, y),    # Right
-            (x - 1, y),    # Left
-            (x, y + 1),    # Bottom
-            (x, y - 1),    # Top
-            (x + 1, y + 1),  # Bottom-right
-            (x - 1, y + 1),  # Bottom-left
-            (x + 1, y - 1),  # Top-right
-            (x - 1, y - 1),  # Top-left
-        ]
-        
-        return any((pos_x, pos_y) in self.blocks for pos_x, pos_y in adjacent_positions)
+        # Interior cells read the grid directly; neighbours of edge cells may
+        # fall outside the grid, so those go through the bounds-checked get_block
+        if 0 < x < WORLD_WIDTH - 1 and 0 < y < WORLD_HEIGHT - 1:
+            g = self.grid
+            return bool(g[x + 1, y] or g[x - 1, y] or          # Right, left
+                        g[x, y + 1] or g[x, y - 1] or          # Bottom, top
+                        g[x + 1, y + 1] or g[x - 1, y + 1] or  # Bottom corners
+                        g[x + 1, y - 1] or g[x - 1, y - 1])    # Top corners
+        get = self.get_block
+        return bool(get(x + 1, y) or get(x - 1, y) or
+                    get(x, y + 1) or get(x, y - 1) or
+                    get(x + 1, y + 1) or get(x - 1, y + 1) or
+                    get(x + 1, y - 1) or get(x - 1, y - 1))
     
     def would_collide_with_player(self, block_x, block_y, player_rect):
         """
@@ -222,7 +340,9 @@ class World:
         block_y = pos[1] // BLOCK_SIZE
         
         # Basic checks
-        if (block_x, block_y) in self.blocks:
+        if not (0 <= block_x < WORLD_WIDTH and 0 <= block_y < WORLD_HEIGHT):
+            return
+        if self.get_block(block_x, block_y):
             return
         if not self.has_adjacent_block(block_x, block_y):
             return
@@ -235,8 +355,8 @@ class World:
         # Range check
         player_block_x = player_rect.centerx // BLOCK_SIZE
         player_block_y = player_rect.centery // BLOCK_SIZE
-        distance = math.sqrt((block_x - player_block_x) ** 2 + (block_y - player_block_y) ** 2)
-        if distance > 3:
+        distance_sq = (block_x - player_block_x) ** 2 + (block_y - player_block_y) ** 2
+        if distance_sq > 3 ** 2:
             return
             
         # Line of sight check
@@ -248,17 +368,19 @@ class World:
             return
             
         # All checks passed, place the block
-        self.blocks[(block_x, block_y)] = Block(block_x, block_y, block_type)
+        self.grid[block_x, block_y] = BLOCK_IDS[block_type]
+        self._redraw_cell(block_x, block_y)
     
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0, camera_y=0):
         """
-        Draw all blocks in the world.
+        Draw the world on the screen by blitting the cached world surface.
         
         Args:
             screen: Pygame surface to draw on
+            camera_x (int): Camera X offset in pixels
+            camera_y (int): Camera Y offset in pixels
         """
-        for block in self.blocks.values():
-            block.draw(screen)
+        screen.blit(self.surface, (-camera_x, -camera_y))
     
     def check_collision(self, rect):
         """
@@ -270,17 +392,55 @@ class World:
         Returns:
             bool: True if there's a collision, False otherwise
         """
-        # Convert rectangle coordinates to grid coordinates
+        # Convert rectangle coordinates to the grid cells it overlaps
+        # (right/bottom are exclusive edges)
         start_x = max(0, rect.left // BLOCK_SIZE)
-        end_x = min(WORLD_WIDTH, (rect.right // BLOCK_SIZE) + 1)
+        end_x = min(WORLD_WIDTH, ((rect.right - 1) // BLOCK_SIZE) + 1)
         start_y = max(0, rect.top // BLOCK_SIZE)
-        end_y = min(WORLD_HEIGHT, (rect.bottom // BLOCK_SIZE) + 1)
+        end_y = min(WORLD_HEIGHT, ((rect.bottom - 1) // BLOCK_SIZE) + 1)
+        
+        # The grid is already a spatial hash, so any solid cell in the
+        # overlapped area is a collision
+        return _collide(self.grid, start_x, end_x, start_y, end_y)
+    
+    def sweep_vertical(self, rect, distance):
+        """
+        Find how far a rectangle can move vertically before hitting a block.
+        Only the grid rows entered by the leading edge are tested, one row
+        at a time, instead of re-checking the whole rect every pixel.
+        A rect that already overlaps a block only moves if its first pixel
+        step clears the overlap, as with per-pixel stepping.
+        
+        Args:
+            rect: Rectangle to move
+            distance (int): Pixels to move (positive is down, negative is up)
+            
+        Returns:
+            int: Distance the rectangle can travel, flush against any block hit
+        """
+        if distance == 0:
+            return 0
+        if self.check_collision(rect):
+            # Rows the rect already overlaps are not re-tested by the sweep
+            step = 1 if distance > 0 else -1
+            if self.check_collision(rect.move(0, step)):
+                return 0
+        
+        start_x = max(0, rect.left // BLOCK_SIZE)
+        end_x = min(WORLD_WIDTH, ((rect.right - 1) // BLOCK_SIZE) + 1)
         
-        # Check collisions with blocks in the area
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                if (x, y) in self.blocks:
-                    block_rect = self.blocks[(x, y)].rect
-                    if rect.colliderect(block_rect):
-                        return True
-        return False
\ No newline at end of file
+        if distance > 0:
+            # Rows newly entered by the bottom edge, nearest first
+            first_row = (rect.bottom - 1) // BLOCK_SIZE + 1
+            last_row = (rect.bottom - 1 + distance) // BLOCK_SIZE
+            for row in range(max(0, first_row), min(WORLD_HEIGHT, last_row + 1)):
+                if _collide(self.grid, start_x, end_x, row, row + 1):
+                    return row * BLOCK_SIZE - rect.bottom
+        elif distance < 0:
+            # Rows newly entered by the top edge, nearest first
+            first_row = rect.top // BLOCK_SIZE - 1
+            last_row = (rect.top + distance) // BLOCK_SIZE
+            for row in range(min(WORLD_HEIGHT - 1, first_row), max(-1, last_row - 1), -1):
+                if _collide(self.grid, start_x, end_x, row, row + 1):
+                    return (row + 1) * BLOCK_SIZE - rect.top
+        return distance
\ No newline at end of file
@@ -2,9 +2,18 @@ import pygame
 import sys
 from game.world import World
 from game.player import Player
-from game.block import Block
+from game.block import COLOR_TABLE
 from game.settings import *
 
+# Number keys mapped to hotbar slots
+KEY_TO_SLOT = {
+    pygame.K_1: 0,
+    pygame.K_2: 1,
+    pygame.K_3: 2,
+    pygame.K_4: 3,
+    pygame.K_5: 4,
+}
+
 class Game:
     """
     Main game class that manages the game loop, rendering, and event handling.
@@ -32,6 +41,29 @@ class Game:
         self.current_block_index = 0  
         self.player.selected_block = self.available_blocks[self.current_block_index]
         
+        # Hotbar preview colors, computed once
+        self.hotbar_colors = [COLOR_TABLE[block_type] for block_type in self.available_blocks]
+        
+        # Hotbar slot numbers never change, so render them once
+        self.hotbar_font = pygame.font.Font(None, 20)
+        self.hotbar_numbers = [self.hotbar_font.render(str(i + 1), True, (255, 255, 255))
+                               for i in range(5)]
+        
+        # Hotbar layout
+        self.hotbar_width = BLOCK_SIZE * 5
+        self.hotbar_height = BLOCK_SIZE
+        self.hotbar_x = (SCREEN_WIDTH - self.hotbar_width) // 2
+        self.hotbar_y = SCREEN_HEIGHT - self.hotbar_height - 10
+        
+        # Screen area covered by the hotbar and the slot numbers above it
+        self.hotbar_area = pygame.Rect(self.hotbar_x, self.hotbar_y - 25,
+                                       self.hotbar_width, self.hotbar_height + 25)
+        
+        # Dirty-rect rendering: screen regions to present on a static view
+        self._dirty = []
+        self._last_camera = None
+        self._last_block_index = self.current_block_index
+        
     def handle_events(self):
         """
         Process all game events including input handling.
@@ -43,6 +75,11 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
                 
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                              pygame.WINDOWRESTORED, pygame.WINDOWFOCUSGAINED):
+                # Window contents may be stale, force a full redraw next frame
+                self._last_camera = None
+                
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Handle mouse wheel for block selection
                 if event.button == 4:  # Wheel up
@@ -62,18 +99,18 @@ class Game:
                     elif event.button == 3:  # Right click to place
                         block_pos = (mouse_pos[0], mouse_pos[1], self.player.rect)
                         self.world.place_block(block_pos, self.player.selected_block)
+                    # The clicked cell may have changed
+                    self._dirty.append(pygame.Rect(
+                        mouse_pos[0] // BLOCK_SIZE * BLOCK_SIZE - self.camera_x,
+                        mouse_pos[1] // BLOCK_SIZE * BLOCK_SIZE - self.camera_y,
+                        BLOCK_SIZE, BLOCK_SIZE))
                         
             if event.type == pygame.KEYDOWN:
                 # Handle number keys for block selection
-                if event.key == pygame.K_1:
-                    self.current_block_index = 0
-                    self.player.selected_block = self.available_blocks[self.current_block_index]
-                elif event.key == pygame.K_2:
-                    self.current_block_index = 1
-                    self.player.selected_block = self.available_blocks[self.current_block_index]
-                elif event.key == pygame.K_3:
-                    self.current_block_index = 2
-                    self.player.selected_block = self.available_blocks[self.current_block_index]
+                slot = KEY_TO_SLOT.get(event.key)
+                if slot is not None and slot < len(self.available_blocks):
+                    self.current_block_index = slot
+                    self.player.selected_block = self.available_blocks[slot]
         return True
 
     def update(self):
@@ -84,34 +121,40 @@ class Game:
         self.camera_y = self.player.rect.centery - SCREEN_HEIGHT // 2
         
     def render(self):
-        """Render the entire game scene including world, player, and UI."""
+        """
+        Render the entire game scene including world, player, and UI.
+        While the camera is still, drawing is clipped to the dirty regions
+        and only those are presented instead of flipping the whole screen.
+        """
+        camera = (self.camera_x, self.camera_y)
+        if camera != self._last_camera:
+            # The view scrolled, so every pixel changed
+            self._last_camera = camera
+            dirty = None
+        else:
+            # The player sprite may have flipped without moving
+            dirty = self._dirty
+            dirty.append(self.player.rect.move(-self.camera_x, -self.camera_y))
+            if self.current_block_index != self._last_block_index:
+                dirty.append(self.hotbar_area)
+            self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+        self._last_block_index = self.current_block_index
+        
         self.screen.fill(SKY_COLOR)
         
-        # Render world blocks with camera offset
-        for block in self.world.blocks.values():
-            block_rect = block.rect.copy()
-            block_rect.x -= self.camera_x
-            block_rect.y -= self.camera_y
-            if -BLOCK_SIZE <= block_rect.x <= SCREEN_WIDTH and -BLOCK_SIZE <= block_rect.y <= SCREEN_HEIGHT:
-                pygame.draw.rect(self.screen, block.color, block_rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), block_rect, 1)
+        # Render the pre-rendered world with camera offset
+        self.world.draw(self.screen, self.camera_x, self.camera_y)
         
         # Render player with camera offset
-        self.player.rect.x -= self.camera_x
-        self.player.rect.y -= self.camera_y
-        self.player.draw(self.screen)
-        self.player.rect.x += self.camera_x
-        self.player.rect.y += self.camera_y
+        self.player.draw(self.screen, self.camera_x, self.camera_y)
         
         # Render hotbar UI
-        hotbar_width = BLOCK_SIZE * 5
-        hotbar_height = BLOCK_SIZE
-        hotbar_x = (SCREEN_WIDTH - hotbar_width) // 2
-        hotbar_y = SCREEN_HEIGHT - hotbar_height - 10
+        hotbar_x = self.hotbar_x
+        hotbar_y = self.hotbar_y
         
         # Draw hotbar background
         pygame.draw.rect(self.screen, (128, 128, 128), 
-                        (hotbar_x, hotbar_y, hotbar_width, hotbar_height))
+                        (hotbar_x, hotbar_y, self.hotbar_width, self.hotbar_height))
         
         # Draw hotbar slots
         for i in range(5):
@@ -120,20 +163,14 @@ class Game:
                            (slot_x, hotbar_y, BLOCK_SIZE, BLOCK_SIZE), 2)
             
             # Draw block preview in slot
-            block_type = None
-            if i < len(self.available_blocks):
-                block_type = self.available_blocks[i]
-                
-            if block_type:
-                temp_block = Block(0, 0, block_type)
+            if i < len(self.hotbar_colors):
                 inner_rect = pygame.Rect(slot_x + 4, hotbar_y + 4, 
                                        BLOCK_SIZE - 8, BLOCK_SIZE - 8)
-                pygame.draw.rect(self.screen, temp_block.color, inner_rect)
+                pygame.draw.rect(self.screen, self.hotbar_colors[i], inner_rect)
                 pygame.draw.rect(self.screen, (0, 0, 0), inner_rect, 1)
                 
             # Draw slot number
-            font = pygame.font.Font(None, 20)
-            text = font.render(str(i + 1), True, (255, 255, 255))
+            text = self.hotbar_numbers[i]
             text_rect = text.get_rect(center=(slot_x + BLOCK_SIZE // 2, 
                                             hotbar_y - 15))
             self.screen.blit(text, text_rect)
@@ -143,7 +180,12 @@ class Game:
                 pygame.draw.rect(self.screen, (255, 255, 255), 
                                (slot_x, hotbar_y, BLOCK_SIZE, BLOCK_SIZE), 3)
         
-        pygame.display.flip()
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            self.screen.set_clip(None)
+            pygame.display.update(dirty)
+        self._dirty.clear()
         
     def run(self):
         """Main game loop."""